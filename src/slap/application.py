@@ -218,7 +218,7 @@ class Application:
         project is from the same directory as the repository."""
 
         result: list[Configuration] = list(self.get_target_projects() if targets_only else self.repository.projects())
-        if self.repository.directory not in tuple(p.directory for p in self.repository.projects()):
+        if not any(p.directory == self.repository.directory for p in self.repository.projects()):
             result.insert(0, self.repository)
         return result
 
@@ -276,9 +276,10 @@ class Application:
 
         if only_projects is not None:
             projects: list[Project] = []
+            project_paths = [(p, p.directory.resolve()) for p in self.repository.projects()]
             for only_project in only_projects:
                 project_path = (cwd / only_project).resolve()
-                matching_projects = [p for p in self.repository.projects() if p.directory.resolve() == project_path]
+                matching_projects = [p for p, path in project_paths if path == project_path]
                 if not matching_projects:
                     raise ValueError(f'error: "{only_project}" does not point to a project')
                 projects += matching_projects
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 import enum
+import functools
 import inspect
 import typing as t
 
@@ -62,8 +63,6 @@ def check(
     Use the #get_checks() method to run all methods on an object decorated with this decorator.
     """
 
-    import functools
-
     from slap.application import Application
     from slap.project import Project
 
@@ -96,8 +95,23 @@ def check(
 def get_checks(obj: t.Any, subject: t.Union[Application, Project]) -> t.Iterable[Check]:
     """Call all methods decorated with #check() on the members of *obj*."""
 
-    for key in dir(obj):
-        value = getattr(obj, key)
-        check_type = getattr(value, "__check_type__", None)
-        if check_type is type(subject):
-            yield value(subject)
+    for key in _get_check_method_names(type(obj), type(subject)):
+        yield getattr(obj, key)(subject)
+
+
+_check_method_names: dict[tuple[type, type], tuple[str, ...]] = {}
+
+
+def _get_check_method_names(obj_type: type, subject_type: type) -> tuple[str, ...]:
+    """Returns the names of the methods on *obj_type* that are decorated with #check() for the given *subject_type*.
+    The result is cached, as scanning all members of a class with #dir() is relatively expensive and the same check
+    plugins are queried for every project."""
+
+    key = (obj_type, subject_type)
+    if key not in _check_method_names:
+        _check_method_names[key] = tuple(
+            name
+            for name in dir(obj_type)
+            if getattr(getattr(obj_type, name, None), "__check_type__", None) is subject_type
+        )
+    return _check_method_names[key]
@@ -62,8 +62,6 @@ class AddCommandPlugin(VenvAwareCommand, ApplicationPlugin):
         app.cleo.add(self)
 
     def handle(self) -> int:
-        from nr.util.stream import Stream
-
         from slap.install.installer import InstallOptions, PipInstaller, get_indexes_for_projects
         from slap.python.environment import PythonEnvironment
 
@@ -92,15 +90,12 @@ class AddCommandPlugin(VenvAwareCommand, ApplicationPlugin):
         distributions = python.get_distributions(dependencies.keys())
         where = "dev" if self.option("dev") else (self.option("extra") or "run")
 
-        to_install = (
-            Stream(dependencies.values())
-            .map(lambda dep: (dep, distributions[dep.name]))
-            .filter(
-                lambda item: self.option("upgrade") or item[1] is None or not item[0].version.accepts(item[1].version)
-            )
-            .map(lambda item: item[0])
-            .collect()
-        )
+        upgrade = self.option("upgrade")
+        to_install = [
+            dep
+            for dep in dependencies.values()
+            if upgrade or (dist := distributions[dep.name]) is None or not dep.version.accepts(dist.version)
+        ]
 
         if to_install:
             indexes = get_indexes_for_projects([project])
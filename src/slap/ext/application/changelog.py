@@ -302,13 +302,19 @@ class ChangelogDiffBaseCommand(Command):
             old_changelog = manager.load(io.StringIO(old_data.decode()))
 
         # Load the new changelog contents.
-        new_changelog: Changelog | None = None
+        new_data: bytes | None = None
         if self.head_ref:
             new_data = self.vcs.get_file_contents(changelog_path, self.head_ref)
-            if new_data is not None:
-                new_changelog = manager.load(io.StringIO(new_data.decode()))
         elif changelog_path.is_file():
-            new_changelog = manager.load(changelog_path)
+            new_data = changelog_path.read_bytes()
+
+        # If the file contents are identical, all entries are unchanged and we don't need to parse them twice.
+        if old_data == new_data:
+            return ChangelogDiff(unchanged_entries=list(old_changelog.entries) if old_changelog else [])
+
+        new_changelog: Changelog | None = None
+        if new_data is not None:
+            new_changelog = manager.load(io.StringIO(new_data.decode()))
 
         old_entries = {e.id: e for e in old_changelog.entries} if old_changelog else {}
         new_entries = {e.id: e for e in new_changelog.entries} if new_changelog else {}
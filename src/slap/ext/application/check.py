@@ -10,6 +10,9 @@ from slap.check import Check, CheckResult
 from slap.plugins import ApplicationPlugin, CheckPlugin
 from slap.project import Project
 
+if t.TYPE_CHECKING:
+    from nr.util.functional import Once
+
 logger = logging.getLogger(__name__)
 DEFAULT_PLUGINS = ["changelog", "general", "poetry", "release"]
 COLORS = {
@@ -31,7 +34,9 @@ class CheckCommandPlugin(Command, ApplicationPlugin):
     """Run sanity checks on your Python project."""
 
     app: Application
-    config: dict[Project, CheckConfig]
+
+    #: The check configuration of the target projects, parsed only once the command is run.
+    config: "Once[dict[Project, CheckConfig]]"
 
     name = "check"
     options = [
@@ -49,8 +54,19 @@ class CheckCommandPlugin(Command, ApplicationPlugin):
     def __init__(self, app: Application) -> None:
         Command.__init__(self)
         ApplicationPlugin.__init__(self, app)
+        self._plugins: dict[str, CheckPlugin] = {}
+
+    def load_configuration(self, app: "Application") -> "Once[dict[Project, CheckConfig]]":
+        from nr.util.functional import Once
+
+        return Once(lambda: self._load_check_configs(app))
+
+    def activate(self, app: "Application", config: "Once[dict[Project, CheckConfig]]") -> None:
+        self.app = app
+        self.config = config
+        app.cleo.add(self)
 
-    def load_configuration(self, app: "Application") -> dict[Project, CheckConfig]:
+    def _load_check_configs(self, app: "Application") -> dict[Project, CheckConfig]:
         import databind.json
 
         result = {}
@@ -59,11 +75,6 @@ class CheckCommandPlugin(Command, ApplicationPlugin):
             result[project] = config
         return result
 
-    def activate(self, app: "Application", config: dict[Project, CheckConfig]) -> None:
-        self.app = app
-        self.config = config
-        app.cleo.add(self)
-
     def handle(self) -> int:
 
         counter: t.MutableMapping[CheckResult, int] = collections.defaultdict(int)
@@ -113,10 +124,18 @@ class CheckCommandPlugin(Command, ApplicationPlugin):
                 for line in check.details.splitlines():
                     self.io.write_line(f"    {line}")
 
+    def _load_plugin(self, plugin_name: str) -> CheckPlugin:
+        """Internal. Loads a check plugin by name, reusing the instance if it was loaded before."""
+
+        plugin = self._plugins.get(plugin_name)
+        if plugin is None:
+            plugin = self._plugins[plugin_name] = load_entrypoint(CheckPlugin, plugin_name)()
+        return plugin
+
     def _run_project_checks(self, project: Project) -> t.Iterator[Check]:
         checks = []
-        for plugin_name in sorted(self.config[project].plugins):
-            plugin = load_entrypoint(CheckPlugin, plugin_name)()
+        for plugin_name in sorted(self.config()[project].plugins):
+            plugin = self._load_plugin(plugin_name)
             try:
                 for check in sorted(plugin.get_project_checks(project), key=lambda c: c.name):
                     check.name = f"{plugin_name}:{check.name}"
@@ -151,10 +170,10 @@ class CheckCommandPlugin(Command, ApplicationPlugin):
             self.line("")
 
     def _run_application_checks(self) -> t.Iterable[Check]:
-        plugin_names = {p for project in self.app.get_target_projects() for p in self.config[project].plugins}
+        plugin_names = {p for project in self.app.get_target_projects() for p in self.config()[project].plugins}
         checks = []
         for plugin_name in sorted(plugin_names):
-            plugin = load_entrypoint(CheckPlugin, plugin_name)()
+            plugin = self._load_plugin(plugin_name)
             try:
                 for check in sorted(plugin.get_application_checks(self.app), key=lambda c: c.name):
                     check.name = f"{plugin_name}:{check.name}"
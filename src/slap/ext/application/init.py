@@ -5,7 +5,6 @@ from typing import Iterable
 
 from slap.application import Application, Command, argument, option
 from slap.plugins import ApplicationPlugin
-from slap.util.external.licenses import get_spdx_license_details, wrap_license_text
 from slap.util.vcs import get_git_author
 
 TEMPLATES = ["poetry", "github"]
@@ -95,6 +94,8 @@ class InitCommandPlugin(Command, ApplicationPlugin):
     def handle(self) -> int:
         from nr.util.optional import Optional
 
+        from slap.util.external.licenses import get_spdx_license_details, wrap_license_text
+
         template = self.option("template")
         if template not in TEMPLATES:
             self.line_error(f'error: template "{template}" does not exist', "error")
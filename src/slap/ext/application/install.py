@@ -16,6 +16,8 @@ from slap.plugins import ApplicationPlugin
 from slap.project import Project
 
 if t.TYPE_CHECKING:
+    from nr.util.functional import Once
+
     from slap.install.installer import Indexes
     from slap.python.dependency import Dependency
     from slap.python.environment import PythonEnvironment
@@ -89,6 +91,10 @@ class InstallCommandPlugin(VenvAwareCommand, ApplicationPlugin):
     """Install your project and its dependencies via Pip."""
 
     app: Application
+
+    #: The install configuration of the repository and its projects, parsed only once the command is run.
+    config: Once[dict[Configuration, InstallConfig]]
+
     name = "install"
     options = VenvAwareCommand.options + [
         option(
@@ -150,24 +156,28 @@ class InstallCommandPlugin(VenvAwareCommand, ApplicationPlugin):
     ]
 
     def load_configuration(self, app: Application) -> None:
-        from databind.json import load
+        from nr.util.functional import Once
 
-        self.config: dict[Configuration, InstallConfig] = {}
-        for obj in app.configurations():
-            self.config[obj] = load(obj.raw_config().get("install", {}), InstallConfig, filename=str(obj))
+        self.config = Once(lambda: self._load_install_configs(app))
         return None
 
     def activate(self, app: Application, config: None) -> None:
         self.app = app
         app.cleo.add(self)
 
+    def _load_install_configs(self, app: Application) -> dict[Configuration, InstallConfig]:
+        from databind.json import load
+
+        return {
+            obj: load(obj.raw_config().get("install", {}), InstallConfig, filename=str(obj))
+            for obj in app.configurations()
+        }
+
     def handle(self) -> int:
         """
         Installs the requirements of the package using Pip.
         """
 
-        from nr.util.stream import Stream
-
         from slap.install.installer import InstallOptions, PipInstaller, get_indexes_for_projects
         from slap.python.dependency import PathDependency, PypiDependency, parse_dependencies
         from slap.python.environment import PythonEnvironment
@@ -196,13 +206,12 @@ class InstallCommandPlugin(VenvAwareCommand, ApplicationPlugin):
 
         # Get a list of the projects that need to be installed that also includes all the projects required through
         # interdependencies between the projects.
-        projects_plus_dependencies = (
-            Stream(projects)
-            .map(lambda p: p.get_interdependencies(self.app.repository.projects(), recursive=True))
-            .concat()
-            .append(projects)
-            .distinct()
-            .collect()
+        all_projects = self.app.repository.projects()
+        projects_plus_dependencies = list(
+            dict.fromkeys(
+                [dep for project in projects for dep in project.get_interdependencies(all_projects, recursive=True)]
+                + projects
+            )
         )
 
         install_extras = self._get_extras_to_install()
@@ -239,7 +248,7 @@ class InstallCommandPlugin(VenvAwareCommand, ApplicationPlugin):
             # we always consider the ones configured in #InstallConfig.dev_extras.
             current_project_install_extras = set(install_extras)
             if not self.option("no-dev"):
-                config = self.config[project]
+                config = self.config()[project]
                 if config.dev_extras is not None:
                     current_project_install_extras.update(config.dev_extras)
 
@@ -252,7 +261,7 @@ class InstallCommandPlugin(VenvAwareCommand, ApplicationPlugin):
                     dependencies += extra_deps
 
         # Look for extras also in the Slap specific install configuration.
-        for _, config in self.config.items():
+        for _, config in self.config().items():
             for extra in install_extras:
                 dependencies += parse_dependencies(config.extras.get(extra, []))
                 discovered_extras.add(extra)
@@ -315,9 +324,9 @@ class InstallCommandPlugin(VenvAwareCommand, ApplicationPlugin):
         if not self.option("no-dev") and not self.option("only-extras"):
             extras.add("dev")
 
-        if not self.option("no-dev") and self.app.repository in self.config:
+        if not self.option("no-dev") and self.app.repository in self.config():
             # Add the dev extras from the repository configuration.
-            extras.update(self.config[self.app.repository].dev_extras or [])
+            extras.update(self.config()[self.app.repository].dev_extras or [])
 
         return extras
 
@@ -111,6 +111,7 @@ def link_repository(io: IO, projects: list[Project], dump_pyproject: bool = Fals
     python_bin = shutil.which(python or "python")
     if not python_bin:
         raise Exception(f"Could not find Python executable from {python_bin!r}")
+    python_bin = str(Path(python_bin).absolute())
 
     # Without this set, the installer will complain about installing as the root user. If we want to
     # have a similar check in Slap, we must do it in the install command as well, otherwise you end
@@ -125,9 +126,9 @@ def link_repository(io: IO, projects: list[Project], dump_pyproject: bool = Fals
         if not packages:
             continue
 
+        dist_name = project.dist_name() or project.directory.resolve().name
         for package in packages:
             config = project.pyproject_toml.value()
-            dist_name = project.dist_name() or project.directory.resolve().name
             _setup_flit_config(package.name, dist_name, config)
 
             if dump_pyproject:
@@ -139,9 +140,7 @@ def link_repository(io: IO, projects: list[Project], dump_pyproject: bool = Fals
                 fp.close()
                 project.pyproject_toml.value(config)
                 project.pyproject_toml.save()
-                installer = Installer.from_ini_path(
-                    project.pyproject_toml.path, python=str(Path(python_bin).absolute()), symlink=True
-                )
+                installer = Installer.from_ini_path(project.pyproject_toml.path, python=python_bin, symlink=True)
                 io.write_line(f"symlinking <info>{dist_name}</info>")
                 installer.install()
 
@@ -149,15 +148,13 @@ def link_repository(io: IO, projects: list[Project], dump_pyproject: bool = Fals
 def _setup_flit_config(module: str, dist_name: str, data: dict[str, t.Any]) -> None:
     """Internal. Makes sure the configuration in *data* is compatible with Flit."""
 
-    poetry = data["tool"].get("poetry", {})
-    flit = data["tool"].setdefault("flit", {})
-    plugins = poetry.get("plugins", {})
-    scripts = poetry.get("scripts", {})
-    project = data.setdefault("project", {})
+    tool = data["tool"]
+    poetry = tool.get("poetry", {})
 
-    if plugins:
+    project: dict[str, t.Any] = {}
+    if plugins := poetry.get("plugins"):
         project["entry-points"] = plugins
-    if scripts:
+    if scripts := poetry.get("scripts"):
         project["scripts"] = scripts
 
     # TODO (@NiklasRosenstein): Do we need to support gui-scripts as well?
@@ -165,4 +162,6 @@ def _setup_flit_config(module: str, dist_name: str, data: dict[str, t.Any]) -> N
     project["name"] = dist_name
     project["version"] = poetry["version"]
     project["description"] = ""
-    flit["module"] = {"name": module}
+
+    data.setdefault("project", {}).update(project)
+    tool.setdefault("flit", {})["module"] = {"name": module}
@@ -3,9 +3,6 @@ import tempfile
 from pathlib import Path
 from typing import Iterable
 
-import build
-import build.env
-
 from slap.application import Application, Command, option
 from slap.install.installer import PipInstaller
 from slap.plugins import ApplicationPlugin
@@ -70,6 +67,8 @@ class PublishCommandPlugin(Command, ApplicationPlugin):
         app.cleo.add(self)
 
     def handle(self) -> int:
+        import build
+        import build.env
         from twine.commands.upload import upload
         from twine.settings import Settings
 
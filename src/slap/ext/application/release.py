@@ -14,6 +14,7 @@ from slap.plugins import ApplicationPlugin, ReleasePlugin, VersionIncrementingRu
 from slap.project import Project
 
 if t.TYPE_CHECKING:
+    from nr.util.functional import Once
     from poetry.core.semver.version import Version  # type: ignore[import]
 
     from slap.release import VersionRef
@@ -115,7 +116,9 @@ class ReleaseCommandPlugin(Command, ApplicationPlugin):
     """  # noqa: E501
 
     app: Application
-    config: dict[Configuration, ReleaseConfig]
+
+    #: The release configuration of the repository and its projects, parsed only once the command is run.
+    config: Once[dict[Configuration, ReleaseConfig]]
 
     name = "release"
     arguments = [
@@ -144,21 +147,30 @@ class ReleaseCommandPlugin(Command, ApplicationPlugin):
     def __init__(self, app: Application) -> None:
         Command.__init__(self)
         ApplicationPlugin.__init__(self, app)
+        self._plugins: dict[str, ReleasePlugin] = {}
+
+    def load_configuration(self, app: Application) -> Once[dict[Configuration, ReleaseConfig]]:
+        from nr.util.functional import Once
+
+        self.app = app
+        self.config = Once(self._load_release_configs)
+        return self.config
+
+    def activate(self, app: Application, config: Once[dict[Configuration, ReleaseConfig]]) -> None:
+        app.cleo.add(self)
+
+    def _load_release_configs(self) -> dict[Configuration, ReleaseConfig]:
+        """Internal. Parses the release configuration of the repository and all of its projects. This is deferred
+        until the configuration is first needed, so that other commands do not pay for it on startup."""
 
-    def load_configuration(self, app: Application) -> dict[Configuration, ReleaseConfig]:
         import databind.json
 
         result = {}
-        for project in t.cast(list[Configuration], [app.repository] + app.repository.projects()):  # type: ignore[operator]  # noqa: E501
+        for project in t.cast(list[Configuration], [self.app.repository] + self.app.repository.projects()):  # type: ignore[operator]  # noqa: E501
             data = project.raw_config().get("release", {})
             result[project] = databind.json.load(data, ReleaseConfig)
-        self.app = app
-        self.config = result
         return result
 
-    def activate(self, app: Application, config: dict[Project, ReleaseConfig]) -> None:
-        app.cleo.add(self)
-
     def _validate_options(self) -> int:
         """Internal. Ensures that the combination of provided options make sense."""
 
@@ -195,15 +207,18 @@ class ReleaseCommandPlugin(Command, ApplicationPlugin):
         return 0
 
     def _load_plugins(self, configuration: Configuration) -> list[ReleasePlugin]:
-        """Internal. Loads the plugins for the given configuration."""
+        """Internal. Loads the plugins for the given configuration. Plugin instances are shared between all
+        configurations that use the same plugin, so every plugin is loaded only once."""
 
         from nr.util.plugins import load_entrypoint
 
         plugins = []
-        for plugin_name in self.config[configuration].plugins:
-            plugin = load_entrypoint(ReleasePlugin, plugin_name)()
-            plugin.app = self.app
-            plugin.io = self.io
+        for plugin_name in self.config()[configuration].plugins:
+            plugin = self._plugins.get(plugin_name)
+            if plugin is None:
+                plugin = self._plugins[plugin_name] = load_entrypoint(ReleasePlugin, plugin_name)()
+                plugin.app = self.app
+                plugin.io = self.io
             plugins.append(plugin)
         return plugins
 
@@ -257,7 +272,7 @@ class ReleaseCommandPlugin(Command, ApplicationPlugin):
         if not self.is_git_repository or self.option("no-branch-check"):
             return True
 
-        config = self.config[self.app.repository]
+        config = self.config()[self.app.repository]
 
         try:
             current_branch = self.git.get_current_branch_name()
@@ -281,9 +296,15 @@ class ReleaseCommandPlugin(Command, ApplicationPlugin):
         if not self.is_git_repository or self.option("no-worktree-check"):
             return True
 
-        queried_files = {f.resolve() for f in required_files}
-        tracked_files = {Path(f).resolve() for f in self.git.get_files()}
-        if untracked_files := queried_files - tracked_files:
+        # NOTE: Resolving every file tracked by Git is slow in large repositories, so we first compare absolute paths
+        #       and only fall back to comparing resolved paths for files that may be reached through a symlink.
+        queried_files = {f.absolute() for f in required_files}
+        tracked_files = {Path(f).absolute() for f in self.git.get_files()}
+        untracked_files = queried_files - tracked_files
+        if untracked_files:
+            resolved_tracked_files = {f.resolve() for f in tracked_files}
+            untracked_files = {f for f in untracked_files if f.resolve() not in resolved_tracked_files}
+        if untracked_files:
             self.line_error("error: some of the files with version references are not tracked by Git", "error")
             for fn in untracked_files:
                 self.line_error(f"  · {fn}", "error")
@@ -336,7 +357,6 @@ class ReleaseCommandPlugin(Command, ApplicationPlugin):
     def _bump_version(self, version_refs: list[VersionRef], target_version: Version, dry: bool) -> list[Path]:
         """Internal. Replaces the version reference in all files with the specified *version*."""
 
-        from nr.util import Stream
         from nr.util.text import substitute_ranges
 
         self.line(
@@ -348,19 +368,26 @@ class ReleaseCommandPlugin(Command, ApplicationPlugin):
 
         self._show_version_refs(version_refs, str(target_version))
         self.line("")
-        for filename, refs in Stream(version_refs).groupby(lambda r: r.file):
+
+        # Group the references by file so that every file is read and written only once, regardless of the order
+        # of the references.
+        refs_by_file: dict[Path, list[VersionRef]] = {}
+        for ref in version_refs:
+            refs_by_file.setdefault(ref.file, []).append(ref)
+
+        for filename, refs in refs_by_file.items():
             with open(filename) as fp:
                 content = fp.read()
 
-            content = substitute_ranges(
+            new_content = substitute_ranges(
                 content,
                 ((ref.start, ref.end, str(target_version)) for ref in refs),
             )
 
             changed_files.append(filename)
-            if not dry:
+            if not dry and new_content != content:
                 with open(filename, "w") as fp:
-                    fp.write(content)
+                    fp.write(new_content)
 
         for plugin in self._load_plugins(self.app.repository):
             try:
@@ -378,7 +405,7 @@ class ReleaseCommandPlugin(Command, ApplicationPlugin):
 
         # TODO (@NiklasRosenstein): If this step errors, revert the changes made by the command so far?
 
-        config = self.config[self.app.repository]
+        config = self.config()[self.app.repository]
 
         if "{version}" not in config.tag_format:
             self.line_error("<info>tool.slap.release.tag-format<info> must contain <info>{version}</info>", "error")
@@ -423,7 +450,7 @@ class ReleaseCommandPlugin(Command, ApplicationPlugin):
             if project.pyproject_toml.exists() and isinstance(project, Project):
                 version_refs += project.get_version_refs()
 
-            for config in self.config[project].references:
+            for config in self.config()[project].references:
                 pattern = config.pattern.replace("{version}", r"(.*?)")
                 version_ref = match_version_ref_pattern(project.directory / config.file, pattern)
                 if version_ref and version_ref.value == "":
@@ -485,7 +512,7 @@ class ReleaseCommandPlugin(Command, ApplicationPlugin):
             changed_files = self._bump_version(version_refs, target_version, self.option("dry"))
 
             run_once = False
-            for obj, config in self.config.items():
+            for obj, config in self.config().items():
                 if isinstance(obj, Project) and obj.directory == self.app.repository.directory:
                     continue
                 if config.pre_commit:
@@ -4,13 +4,13 @@ import json
 import logging
 import typing as t
 
-import pkg_resources
-
 from slap.application import Application, option
 from slap.ext.application.venv import VenvAwareCommand
 from slap.plugins import ApplicationPlugin
 
 if t.TYPE_CHECKING:
+    import pkg_resources
+
     from slap.python.dependency import Dependency
 
 logger = logging.getLogger(__name__)
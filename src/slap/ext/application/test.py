@@ -1,8 +1,12 @@
+import collections
 import logging
+import operator
 import os
+import threading
 import typing as t
 from pathlib import Path
 
+from cleo.io.io import OutputType  # type: ignore[import]
 from nr.util.singleton import NotSet
 
 from slap.application import IO, Application, argument, option
@@ -18,6 +22,9 @@ class TestRunner:
     _colors = ["blue", "cyan", "magenta", "yellow"]
     _prev_color: t.ClassVar[str | None] = None
 
+    #: Guards writes to the #IO so that the output of tests that run in parallel does not tear lines apart.
+    _write_lock: t.ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, name: str, config: t.Any, io: IO, cwd: Path | None = None, line_prefixing: bool = True) -> None:
         assert isinstance(config, str), type(config)
         self.name = name
@@ -25,26 +32,28 @@ class TestRunner:
         self.io = io
         self.cwd = cwd
         self.line_prefixing = line_prefixing
+        self.color = (
+            self._colors[0]
+            if TestRunner._prev_color is None
+            else self._colors[(self._colors.index(TestRunner._prev_color) + 1) % len(self._colors)]
+        )
+        TestRunner._prev_color = self.color
+
+    def _write_line(self, prefix: str, line: str) -> None:
+        with self._write_lock:
+            if self.line_prefixing:
+                self.io.write(f"<fg={self.color}>{prefix}</fg>")
+            self.io.write(line + "\n", type=OutputType.NORMAL)
 
     def run(self) -> int:
         import subprocess as sp
         import sys
-        from codecs import getreader
-
-        from cleo.io.io import OutputType  # type: ignore[import]
 
         if os.name != "nt":
             from ptyprocess import PtyProcessUnicode  # type: ignore[import]
         else:
             PtyProcessUnicode = None
 
-        color = (
-            self._colors[0]
-            if TestRunner._prev_color is None
-            else self._colors[(self._colors.index(TestRunner._prev_color) + 1) % len(self._colors)]
-        )
-        TestRunner._prev_color = color
-
         if os.name == "nt":
             command = ["cmd", "/k", self.config]
         else:
@@ -61,30 +70,77 @@ class TestRunner:
         except OSError:
             sproc = sp.Popen(command, cwd=self.cwd, stdout=sp.PIPE, stderr=sp.STDOUT)
             assert sproc.stdout
-            stdout = getreader(sys.getdefaultencoding())(sproc.stdout)
-            for line in iter(stdout.readline, ""):
-                line = line.rstrip()
-                if self.line_prefixing:
-                    self.io.write(f"<fg={color}>{prefix}</fg>")
-                self.io.write(line + "\n", type=OutputType.NORMAL)
+            for line in _iter_lines(_read_fd(sproc.stdout.fileno(), sys.getdefaultencoding())):
+                self._write_line(prefix, line.rstrip())
             sproc.wait()
             assert sproc.returncode is not None
             return sproc.returncode
         else:
             proc = PtyProcessUnicode.spawn(command, dimensions=(rows, cols - len(prefix)), cwd=self.cwd)
-            while not proc.eof():
-                try:
-                    line = proc.readline().rstrip()
-                except EOFError:
-                    break
-                if self.line_prefixing:
-                    self.io.write(f"<fg={color}>{prefix}</fg>")
-                self.io.write(line + "\n", type=OutputType.NORMAL)
+            for line in _iter_lines(_read_pty(proc), universal_newlines=False):
+                self._write_line(prefix, line.rstrip())
             proc.wait()
             assert proc.exitstatus is not None
             return proc.exitstatus
 
 
+#: The maximum number of bytes to read from a test command's output at once.
+READ_CHUNK_SIZE = 65536
+
+
+def _read_fd(fd: int, encoding: str) -> t.Iterator[str]:
+    """Internal. Reads and decodes chunks from the file descriptor *fd* until EOF."""
+
+    from codecs import getincrementaldecoder
+
+    decoder = getincrementaldecoder(encoding)(errors="replace")
+    while chunk := os.read(fd, READ_CHUNK_SIZE):
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def _read_pty(proc: t.Any) -> t.Iterator[str]:
+    """Internal. Reads chunks from a #ptyprocess.PtyProcessUnicode until EOF."""
+
+    while True:
+        try:
+            yield proc.read(READ_CHUNK_SIZE)
+        except EOFError:
+            break
+
+
+def _iter_lines(chunks: t.Iterable[str], universal_newlines: bool = True) -> t.Iterator[str]:
+    """Internal. Splits a stream of text *chunks* into lines, not including the line separators. With
+    *universal_newlines*, lines are split like #str.splitlines() does, i.e. also at a lone carriage return as used by
+    progress bars. Otherwise, lines are only split at line feeds."""
+
+    pending: list[str] = []  # Parts of the current line, joined only once the line is complete.
+    skip_lf = False  # The previous chunk ended with a carriage return that may be followed by a line feed.
+    for chunk in chunks:
+        if skip_lf and chunk.startswith("\n"):
+            chunk = chunk[1:]
+            skip_lf = False
+        if not chunk:
+            continue
+        if universal_newlines:
+            skip_lf = chunk.endswith("\r")
+            lines = chunk.splitlines()
+            if chunk[-1:].splitlines() == [""]:
+                lines.append("")
+        else:
+            lines = chunk.split("\n")
+        *complete, partial = lines
+        if complete:
+            pending.append(complete[0])
+            yield "".join(pending)
+            yield from complete[1:]
+            pending = []
+        if partial:
+            pending.append(partial)
+    if pending:
+        yield "".join(pending)
+
+
 class Test(t.NamedTuple):
     project: Project
     name: str
@@ -146,6 +202,13 @@ class TestCommandPlugin(VenvAwareCommand, ApplicationPlugin):
             flag=False,
             multiple=True,
         ),
+        option(
+            "--jobs",
+            "-j",
+            description="The number of tests to run in parallel.",
+            flag=False,
+            default="1",
+        ),
     ]
 
     # Hack to set a default value for the flag.
@@ -166,17 +229,21 @@ class TestCommandPlugin(VenvAwareCommand, ApplicationPlugin):
                 tests.append(Test(project, test_name, command))
         return tests
 
-    def _select_tests(self, name: str) -> set[Test]:
-        result = set()
-        for test in self.tests:
-            use_test = (
-                self.app.repository.is_monorepo
-                and (name == test.id or (name.startswith(":") and test.name == name[1:]) or (test.project.id == name))
-                or not self.app.repository.is_monorepo
-                and (name == test.name)
-            )
-            if use_test:
-                result.add(test)
+    def _index_tests(self, tests: list[Test]) -> dict[str, set[Test]]:
+        """Internal. Maps every name that can be used to select tests to the set of tests that it selects."""
+
+        index: dict[str, set[Test]] = collections.defaultdict(set)
+        is_monorepo = self.app.repository.is_monorepo
+        for test in tests:
+            if is_monorepo:
+                for key in (test.id, ":" + test.name, test.project.id):
+                    index[key].add(test)
+            else:
+                index[test.name].add(test)
+        return index
+
+    def _select_tests(self, name: str, index: dict[str, set[Test]]) -> set[Test]:
+        result = index.get(name)
         if not result:
             raise ValueError(f"{name!r} did not match any tests")
         return result
@@ -193,38 +260,58 @@ class TestCommandPlugin(VenvAwareCommand, ApplicationPlugin):
                 print(test.id)
             return 0
 
-        if not self.tests:
+        all_tests = self.tests
+        if not all_tests:
             self.line_error("error: no tests configured", "error")
             return 1
 
+        try:
+            jobs = int(self.option("jobs"))
+            if jobs < 1:
+                raise ValueError
+        except ValueError:
+            self.line_error(f'error: invalid value for <opt>-j,--jobs</opt>: "{self.option("jobs")}"', "error")
+            return 1
+
         test_names: list[str] = self.argument("test")
         exclude_tests: list[str] = self.option("exclude")
 
+        index = self._index_tests(all_tests)
+        single_project = len({t.project for t in all_tests}) == 1
+
         if not test_names:
-            tests = set(self.tests)
+            tests = set(all_tests)
         else:
             try:
-                tests = {t for a in test_names for t in self._select_tests(a)}
+                tests = {t for a in test_names for t in self._select_tests(a, index)}
             except ValueError as exc:
                 self.line_error(f"error: {exc}", "error")
                 return 1
 
-        tests -= {t for a in exclude_tests for t in self._select_tests(a)}
+        tests -= {t for a in exclude_tests for t in self._select_tests(a, index)}
 
         if (no_line_prefix := self.option("no-line-prefix")) is NotSet.Value:
             no_line_prefix = test_names is not None and len(tests) == 1
 
-        single_project = len(set(t.project for t in self.tests)) == 1
-
-        results = {}
-        for test in sorted(tests, key=lambda t: t.id):
-            results[test.name if single_project else test.id] = TestRunner(
-                test.name if single_project else test.id,
+        runners: dict[str, TestRunner] = {}
+        for test in sorted(tests, key=operator.attrgetter("id")):
+            label = test.name if single_project else test.id
+            runners[label] = TestRunner(
+                label,
                 test.command,
                 self.io,
                 test.project.directory,
                 not no_line_prefix,
-            ).run()
+            )
+
+        if jobs == 1:
+            results = {name: runner.run() for name, runner in runners.items()}
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = {name: executor.submit(runner.run) for name, runner in runners.items()}
+                results = {name: future.result() for name, future in futures.items()}
 
         if len(tests) > 1:
             self.line("\n<comment>test summary:</comment>")
@@ -119,13 +119,13 @@ class PoetryChecksPlugin(CheckPlugin):
         """Checks if package license is a valid SPDX license identifier and recommends to configure a license if
         none is set."""
 
-        from slap.util.external.licenses import get_spdx_licenses
+        from slap.util.external.licenses import get_spdx_license_index
 
         license = self.poetry.get("license")
         if not license:
             return Check.ERROR, "Missing license"
         else:
-            if license not in get_spdx_licenses():
+            if license not in get_spdx_license_index():
                 return Check.WARNING, f'License <s>"{license}"</s> is not a known SPDX license identifier.'
             else:
                 return Check.OK, f'License <s>"{license}"</s> is a valid SPDX identifier.'
@@ -106,9 +106,7 @@ def parse_list_semi(val: str) -> list[str]:
 
     [1]: https://setuptools.pypa.io/en/latest/userguide/declarative_config.html#specifying-values"""
 
-    from nr.util.stream import Stream
-
-    return Stream(val.splitlines()).map(lambda v: v.split(";")).concat().map(str.strip).filter(bool).collect()
+    return [item for line in val.splitlines() for item in map(str.strip, line.split(";")) if item]
 
 
 def get_setup_cfg_interdependency_version_refs(project: Project) -> list[VersionRef]:
@@ -10,6 +10,8 @@ from slap.changelog import is_url
 from slap.repository import Issue, PullRequest, Repository, RepositoryHost
 
 logger = logging.getLogger(__name__)
+ISSUE_URL_REGEX = re.compile(r"https?://([\w\-\.]+)/(?:|.+/)([\w\-\.\_]+)/([\w\-\.\_]+)/(?:pulls?|issues)/(\d+)")
+REMOTE_URL_REGEX = re.compile(r"github.com[:/]([^/]+/[^/]+)?")
 
 
 @functools.lru_cache()
@@ -50,9 +52,7 @@ class GithubRepositoryHost(RepositoryHost):
         return parts[-2], parts[-1]
 
     def _get_issue_shortform(self, issue_url: str) -> str:
-        match = re.search(
-            r"https?://([\w\-\.]+)/(?:|.+/)([\w\-\.\_]+)/([\w\-\.\_]+)/(?:pulls?|issues)/(\d+)", issue_url
-        )
+        match = ISSUE_URL_REGEX.search(issue_url)
         if match:
             domain, owner, repo, issue_id = match.groups()
             if domain == "github.com" and self.repo == (owner + "/" + repo):
@@ -98,10 +98,13 @@ class GithubRepositoryHost(RepositoryHost):
     def detect_repository_host(repository: Repository) -> RepositoryHost | None:
         from nr.util.git import Git
 
-        git = Git(repository.directory)
-        if not git.get_toplevel():
+        from slap.util.vcs import get_git_toplevel
+
+        if not get_git_toplevel(repository.directory):
             return None
 
+        git = Git(repository.directory)
+
         remotes = git.remotes()
         for remote in remotes:
             if remote.name == "origin" and "github" in remote.fetch:
@@ -109,7 +112,7 @@ class GithubRepositoryHost(RepositoryHost):
         else:
             return None
 
-        match = re.search(r"github.com[:/]([^/]+/[^/]+)?", remote.fetch)
+        match = REMOTE_URL_REGEX.search(remote.fetch)
         if not match:
             return None
 
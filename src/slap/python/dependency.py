@@ -15,6 +15,7 @@ References:
 from __future__ import annotations
 
 import dataclasses
+import functools
 import re
 import typing as t
 from pathlib import Path
@@ -60,9 +61,16 @@ class VersionSpec:
     def accepts(self, version: str) -> bool:
         """Tests if the version spec accepts the given version string."""
 
-        from poetry.core.semver.version import Version  # type: ignore[import]
+        return self.__dependency.constraint.allows(_parse_version(version))
 
-        return self.__dependency.constraint.allows(Version.parse(version))
+
+@functools.lru_cache()
+def _parse_version(version: str) -> t.Any:
+    """Parses a version string with Poetry's #Version class, caching the result."""
+
+    from poetry.core.semver.version import Version  # type: ignore[import]
+
+    return Version.parse(version)
 
 
 @dataclasses.dataclass
@@ -104,11 +104,19 @@ class Pep508Environment:
             scope["extra"] = t.cast(str, ExtrasEq())
 
         try:
-            return _eval_environment_marker_ast(ast.parse(markers, filename=source or "<string>", mode="eval"), scope)
+            return _eval_environment_marker_ast(_parse_environment_markers(markers, source or "<string>"), scope)
         except (ValueError, KeyError) as exc:
             raise ValueError(f"invalid environment marker string: {markers!r}\n  hint: {exc}")
 
 
+@functools.lru_cache()
+def _parse_environment_markers(markers: str, filename: str) -> ast.Expression:
+    """Parses an environment marker string into an AST. The result is cached, as the same markers are usually
+    evaluated many times (e.g. for every dependency that shares them)."""
+
+    return ast.parse(markers, filename=filename, mode="eval")
+
+
 def _eval_environment_marker_ast(node: ast.AST, scope: t.Dict[str, t.Any]) -> bool:
     """Evaluates an environment marker AST using the given *scope*. This is safer than using #eval()
     to avoid arbitrary code execution."""
@@ -92,9 +92,8 @@ class Repository(Configuration):
 
     @property
     def is_monorepo(self) -> bool:
-        if len(self.projects()) > 1 or (len(self.projects()) == 1 and self.projects()[0].directory != self.directory):
-            return True
-        return False
+        projects = self.projects()
+        return len(projects) > 1 or (len(projects) == 1 and projects[0].directory != self.directory)
 
     @property
     def use_shared_venv(self) -> bool:
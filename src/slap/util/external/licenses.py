@@ -7,11 +7,22 @@ Scraper for [SPDX][1].
 from __future__ import annotations
 
 import dataclasses
+import functools
+import logging
+import os
+import time
 import typing as t
 
 import requests
 from databind.core.settings import Alias
 
+#: Connect and read timeout for requests to the SPDX servers.
+REQUEST_TIMEOUT = (5, 30)
+SPDX_LICENSES_URL = "https://raw.githubusercontent.com/spdx/license-list-data/master/json/licenses.json"
+CACHE_DIRECTORY = os.path.expanduser("~/.local/slap/spdx-cache")
+CACHE_TTL = 60 * 60 * 24 * 30  # 30 days
+logger = logging.getLogger(__name__)
+
 
 @dataclasses.dataclass
 class SpdxLicense:
@@ -28,9 +39,7 @@ class SpdxLicense:
     def get_details(self) -> SpdxLicenseDetails:
         import databind.json
 
-        response = requests.get(self.details_url)
-        response.raise_for_status()
-        return databind.json.load(response.json(), SpdxLicenseDetails)
+        return databind.json.load(get_json(self.details_url), SpdxLicenseDetails)
 
 
 @dataclasses.dataclass
@@ -52,39 +61,98 @@ class SpdxLicenseDetails:
     deprecated_version: t.Annotated[str | None, Alias("deprecatedVersion")] = None
 
 
+@functools.lru_cache()
+def get_session() -> requests.Session:
+    """Returns the HTTP session that is shared by all requests in this module. Reusing the session allows subsequent
+    requests to the same host to reuse a pooled connection instead of paying for a new TLS handshake each time."""
+
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    from slap import __version__
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3)))
+    session.headers["User-Agent"] = f"slap/{__version__}"
+    return session
+
+
+def get_json(url: str, force_refresh: bool = False) -> t.Any:
+    """
+    Fetches and decodes the JSON document at *url*. The license data changes rarely, so responses are cached on disk
+    for a maximum of #CACHE_TTL seconds. Specify the *force_refresh* argument to ignore the cache.
+    """
+
+    import hashlib
+    import json
+    import tempfile
+
+    cache_file = os.path.join(CACHE_DIRECTORY, hashlib.sha256(url.encode()).hexdigest() + ".json")
+    if not force_refresh and os.path.isfile(cache_file) and (time.time() - os.path.getmtime(cache_file)) < CACHE_TTL:
+        try:
+            with open(cache_file, "rb") as fp:
+                return json.load(fp)
+        except ValueError:
+            logger.warning('Ignoring invalid cache file "%s" for "%s".', cache_file, url)
+
+    response = get_session().get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    data = response.json()
+
+    # NOTE: Write to a unique temporary file first, so that concurrent Slap processes never see a partial file.
+    try:
+        os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIRECTORY, suffix=".tmp", delete=False) as tmp:
+            tmp.write(response.content)
+        try:
+            os.replace(tmp.name, cache_file)
+        except OSError:
+            os.remove(tmp.name)
+            raise
+    except OSError as exc:
+        logger.warning('Unable to write cache file for "%s": %s', url, exc)
+
+    return data
+
+
 def wrap_license_text(license_text: str, width: int = 79) -> str:
+    """Wraps each line of *license_text* to at most *width* characters. Words are never broken up."""
+
+    import textwrap
+
+    wrapper = textwrap.TextWrapper(
+        width=width, break_long_words=False, break_on_hyphens=False, expand_tabs=False, replace_whitespace=False
+    )
     lines = []
-    for raw_line in license_text.split("\n"):
-        line = raw_line.split(" ")
-        length = sum(map(len, line)) + len(line) - 1
-        if length > width:
-            words: list[str] = []
-            length = -1
-            for word in line:
-                if length + 1 + len(word) >= width:
-                    lines.append(" ".join(words))
-                    words = []
-                    length = -1
-                else:
-                    words.append(word)
-                    length += len(word) + 1
-            if words:
-                lines.append(" ".join(words))
+    for line in license_text.split("\n"):
+        if len(line) <= width:
+            lines.append(line)
         else:
-            lines.append(" ".join(line))
+            lines.extend(wrapper.wrap(line))
     return "\n".join(lines)
 
 
-def get_spdx_licenses() -> dict[str, SpdxLicense]:
-    """Returns a dictionary of all SPDX licenses, keyed by the license ID."""
+@functools.lru_cache(maxsize=1)
+def get_spdx_license_index() -> dict[str, dict[str, t.Any]]:
+    """Returns the raw JSON payload of all SPDX licenses, keyed by the license ID."""
+
+    return {license["licenseId"]: license for license in get_json(SPDX_LICENSES_URL)["licenses"]}
+
+
+def get_spdx_license(license_id: str) -> SpdxLicense:
+    """Returns the SPDX license with the given *license_id*. Raises a #KeyError if there is no such license."""
 
     import databind.json
 
-    url = "https://raw.githubusercontent.com/spdx/license-list-data/master/json/licenses.json"
-    response = requests.get(url)
-    response.raise_for_status()
-    licenses = databind.json.load(response.json()["licenses"], list[SpdxLicense], filename=url)
-    return {line.license_id: line for line in licenses}
+    return databind.json.load(
+        get_spdx_license_index()[license_id], SpdxLicense, filename=f"{SPDX_LICENSES_URL}#{license_id}"
+    )
+
+
+def get_spdx_licenses() -> dict[str, SpdxLicense]:
+    """Returns a dictionary of all SPDX licenses, keyed by the license ID."""
+
+    return {license_id: get_spdx_license(license_id) for license_id in get_spdx_license_index()}
 
 
 def get_spdx_license_details(license_id: str) -> SpdxLicenseDetails:
@@ -93,9 +161,7 @@ def get_spdx_license_details(license_id: str) -> SpdxLicenseDetails:
     import databind.json
 
     url = f"https://spdx.org/licenses/{license_id}.json"
-    response = requests.get(url)
-    response.raise_for_status()
-    return databind.json.load(response.json(), SpdxLicenseDetails, filename=url)
+    return databind.json.load(get_json(url), SpdxLicenseDetails, filename=url)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import abc
 import dataclasses
 import enum
+import functools
 import re
 import typing as t
 from pathlib import Path
@@ -104,15 +105,15 @@ class Vcs(abc.ABC):
 class Git(Vcs):
     def __init__(self, directory: Path) -> None:
         self._git = _Git(directory)
-        assert self._git.get_toplevel() is not None, f"Not a Git repository: {directory}"
+        assert get_git_toplevel(directory) is not None, f"Not a Git repository: {directory}"
 
     def __repr__(self) -> str:
         return f'Git("{self._git.path}")'
 
     def get_toplevel(self) -> Path:
-        toplevel = self._git.get_toplevel()
+        toplevel = get_git_toplevel(self._git.path)
         assert toplevel is not None
-        return Path(toplevel)
+        return toplevel
 
     def get_web_url(self) -> str | None:
         remote = next((r for r in self._git.remotes() if r.name == "origin"), None)
@@ -197,7 +198,7 @@ class Git(Vcs):
 
     @classmethod
     def detect(cls, path: Path) -> t.Union["Git", None]:
-        if _Git(path).get_toplevel() is not None:
+        if get_git_toplevel(path) is not None:
             return Git(path)
         return None
 
@@ -213,18 +214,39 @@ class Git(Vcs):
         }[mode]
 
 
+def get_git_toplevel(directory: Path) -> Path | None:
+    """Return the toplevel directory of the Git repository that contains *directory*, or `None` if it is not inside
+    a Git repository. The result is cached per resolved directory, so that repeatedly querying the same repository
+    only runs `git rev-parse` once per process."""
+
+    return _get_git_toplevel(directory.resolve())
+
+
+@functools.lru_cache()
+def _get_git_toplevel(directory: Path) -> Path | None:
+    toplevel = _Git(directory).get_toplevel()
+    return Path(toplevel) if toplevel is not None else None
+
+
 def get_git_author(path: Path | None = None) -> Author:
     import subprocess as sp
 
     git = _Git(path)
     try:
-        name = git.get_config("user.name") or git.get_config("user.name", global_=True)
-        email = git.get_config("user.email") or git.get_config("user.email", global_=True)
+        output = git.check_output(["git", "config", "--get-regexp", r"^user\.(name|email)$"]).decode()
     except sp.CalledProcessError as exc:
         if exc.returncode != 1:
             raise
         return Author(None, None)
-    return Author(name, email)
+
+    # Git lists the values from the system, global and local configuration in that order, so the last
+    # non-empty occurrence of a key is the one that takes effect.
+    values: dict[str, str] = {}
+    for line in output.splitlines():
+        key, _, value = line.partition(" ")
+        if value:
+            values[key] = value
+    return Author(values.get("user.name"), values.get("user.email"))
 
 
 def detect_vcs(path: Path) -> Vcs | None:
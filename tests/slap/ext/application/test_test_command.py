@@ -0,0 +1,113 @@
+import json
+import os
+import shlex
+import sys
+from pathlib import Path
+
+import pytest
+from cleo.testers.command_tester import CommandTester  # type: ignore[import]
+
+from slap.application import Application
+from slap.ext.application import test
+from slap.ext.application.test import _iter_lines, _read_fd
+
+
+def test__iter_lines__splits_lines_across_chunks():
+    assert list(_iter_lines(["fo", "o\nba", "r\n", "baz\nqux"])) == ["foo", "bar", "baz", "qux"]
+
+
+def test__iter_lines__yields_trailing_line_without_newline():
+    assert list(_iter_lines(["foo\n", "bar"])) == ["foo", "bar"]
+    assert list(_iter_lines(["foo\n"])) == ["foo"]
+
+
+def test__iter_lines__ignores_empty_chunks():
+    assert list(_iter_lines(["", "foo", "", "\n", "", "\n", ""])) == ["foo", ""]
+    assert list(_iter_lines([])) == []
+
+
+def test__iter_lines__universal_newlines():
+    assert list(_iter_lines(["a\rb\r\nc\n"])) == ["a", "b", "c"]
+    assert list(_iter_lines(["a\r", "\nb\r", "c"])) == ["a", "b", "c"]
+    assert list(_iter_lines(["a\r", "\n", "\nb"])) == "a\r\n\nb".splitlines()
+
+
+def test__iter_lines__without_universal_newlines():
+    assert list(_iter_lines(["a\rb\r\n", "c\r", "\n"], universal_newlines=False)) == ["a\rb\r", "c\r"]
+
+
+def read_all(data: bytes, encoding: str = "utf-8") -> str:
+    read_fd, write_fd = os.pipe()
+    try:
+        os.write(write_fd, data)
+        os.close(write_fd)
+        return "".join(_read_fd(read_fd, encoding))
+    finally:
+        os.close(read_fd)
+
+
+def test__read_fd__decodes_multibyte_characters_split_across_chunks(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(test, "READ_CHUNK_SIZE", 1)
+    assert read_all("héllo wörld €".encode()) == "héllo wörld €"
+
+
+def test__read_fd__replaces_invalid_and_truncated_input():
+    assert read_all(b"a\xffb\xe2\x82") == "a�b�"
+
+
+def make_test_command(directory: Path, tests: dict[str, str]) -> CommandTester:
+    lines = [
+        "[tool.poetry]",
+        'name = "example"',
+        'version = "0.1.0"',
+        'description = ""',
+        "authors = []",
+        "",
+        "[tool.slap.test]",
+        *(f"{name} = {json.dumps(command)}" for name, command in tests.items()),
+        "",
+        "[build-system]",
+        'requires = ["poetry-core"]',
+        'build-backend = "poetry.core.masonry.api"',
+    ]
+    (directory / "pyproject.toml").write_text("\n".join(lines) + "\n")
+    app = Application(directory)
+    command = test.TestCommandPlugin(app)
+    command.activate(app, command.load_configuration(app))
+    return CommandTester(command)
+
+
+@pytest.mark.parametrize("jobs", ["0", "-1", "two"])
+def test__TestCommandPlugin__rejects_invalid_jobs(tmp_path: Path, jobs: str):
+    tester = make_test_command(tmp_path, {"hello": "echo hello"})
+    assert tester.execute(f"--jobs={jobs}") == 1
+    error = tester.io.fetch_error()
+    assert "invalid value for" in error
+    assert f'"{jobs}"' in error
+
+
+def test__TestCommandPlugin__runs_tests_in_parallel(tmp_path: Path):
+    # Each test waits until the other one has started, so they can only succeed if they run concurrently.
+    script = tmp_path / "rendezvous.py"
+    script.write_text(
+        "import pathlib, sys, time\n"
+        "pathlib.Path(sys.argv[1]).touch()\n"
+        "deadline = time.time() + 10\n"
+        "while not pathlib.Path(sys.argv[2]).exists():\n"
+        "    if time.time() > deadline:\n"
+        "        sys.exit(1)\n"
+        "    time.sleep(0.01)\n"
+        "print(sys.argv[1])\n"
+    )
+    python = shlex.quote(sys.executable)
+    tester = make_test_command(
+        tmp_path,
+        {
+            "a": f"{python} rendezvous.py {tmp_path / 'a'} {tmp_path / 'b'}",
+            "b": f"{python} rendezvous.py {tmp_path / 'b'} {tmp_path / 'a'}",
+        },
+    )
+    assert tester.execute("-j 2") == 0
+    output = tester.io.fetch_output()
+    assert "a (exit code: 0)" in output
+    assert "b (exit code: 0)" in output
@@ -156,3 +156,32 @@ def test__PypiDependency__parse():
 
     # TODO (@NiklasRosenstein): This is actually a bad example and we should start raising an error for it.
     assert PypiDependency.parse("foo 1.0.0") == PypiDependency("foo 1.0.0", VersionSpec("*"))
+
+
+def test__VersionSpec__accepts():
+    # Inclusive lower and exclusive upper bounds.
+    spec = VersionSpec(">=3.7,<3.11")
+    assert spec.accepts("3.7")
+    assert spec.accepts("3.10.99")
+    assert not spec.accepts("3.6.15")
+    assert not spec.accepts("3.11")
+    assert not spec.accepts("3.11.0rc1")
+
+    # Poetry caret and PEP 440 compatible release specifiers.
+    assert VersionSpec("^3.10").accepts("3.11")
+    assert not VersionSpec("^3.10").accepts("4.0")
+    assert VersionSpec("~=1.4.2").accepts("1.4.9")
+    assert not VersionSpec("~=1.4.2").accepts("1.5")
+
+    # Pre- and post-releases, wildcards and exclusions.
+    spec = VersionSpec(">=1.0.0b2")
+    assert not spec.accepts("1.0.0b1")
+    assert spec.accepts("1.0.0b2")
+    assert spec.accepts("1.0.0rc1")
+    assert spec.accepts("1.0.post1")
+    assert VersionSpec("==1.0.*").accepts("1.0.5")
+    assert not VersionSpec("==1.0.*").accepts("1.1")
+    spec = VersionSpec("!=1.5.7,<2.0,>=1.5.6")
+    assert spec.accepts("1.5.6")
+    assert not spec.accepts("1.5.7")
+    assert spec.accepts("1.5.8")
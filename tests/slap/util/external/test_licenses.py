@@ -0,0 +1,132 @@
+import json
+import os
+import typing as t
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from slap.util.external import licenses
+from slap.util.external.licenses import (
+    SpdxLicense,
+    get_json,
+    get_spdx_license,
+    get_spdx_license_index,
+    wrap_license_text,
+)
+
+URL = "https://example.org/licenses.json"
+
+
+class StubResponse:
+    def __init__(self, data: t.Any) -> None:
+        self.content = json.dumps(data).encode()
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> t.Any:
+        return json.loads(self.content)
+
+
+class StubSession:
+    def __init__(self) -> None:
+        self.data: t.Any = {"version": 1}
+        self.requests: list[str] = []
+
+    def get(self, url: str, timeout: t.Any = None) -> StubResponse:
+        self.requests.append(url)
+        return StubResponse(self.data)
+
+
+@pytest.fixture
+def session(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> StubSession:
+    session = StubSession()
+    monkeypatch.setattr(licenses, "CACHE_DIRECTORY", str(tmp_path))
+    monkeypatch.setattr(licenses, "get_session", lambda: session)
+    return session
+
+
+def test__get_json__uses_cache(session: StubSession, tmp_path: Path) -> None:
+    assert get_json(URL) == {"version": 1}
+    session.data = {"version": 2}
+    assert get_json(URL) == {"version": 1}
+    assert session.requests == [URL]
+    assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+
+
+def test__get_json__refetches_after_ttl(session: StubSession, tmp_path: Path) -> None:
+    assert get_json(URL) == {"version": 1}
+    (cache_file,) = tmp_path.iterdir()
+    expired = cache_file.stat().st_mtime - licenses.CACHE_TTL - 1
+    os.utime(cache_file, (expired, expired))
+    session.data = {"version": 2}
+    assert get_json(URL) == {"version": 2}
+    assert get_json(URL) == {"version": 2}
+    assert session.requests == [URL, URL]
+
+
+def test__get_json__refetches_corrupt_cache_file(session: StubSession, tmp_path: Path) -> None:
+    assert get_json(URL) == {"version": 1}
+    (cache_file,) = tmp_path.iterdir()
+    cache_file.write_text("{not json")
+    session.data = {"version": 2}
+    assert get_json(URL) == {"version": 2}
+    assert json.loads(cache_file.read_text()) == {"version": 2}
+
+
+MIT_LICENSE = {
+    "reference": "https://spdx.org/licenses/MIT.html",
+    "isDeprecatedLicenseId": False,
+    "detailsUrl": "https://spdx.org/licenses/MIT.json",
+    "referenceNumber": 1,
+    "name": "MIT License",
+    "licenseId": "MIT",
+    "seeAlso": ["https://opensource.org/licenses/MIT"],
+    "isOsiApproved": True,
+}
+
+
+@pytest.fixture
+def spdx_session(session: StubSession) -> Iterator[StubSession]:
+    session.data = {"licenses": [MIT_LICENSE]}
+    get_spdx_license_index.cache_clear()
+    yield session
+    get_spdx_license_index.cache_clear()
+
+
+def test__get_spdx_license_index__returns_raw_records_by_id(spdx_session: StubSession) -> None:
+    index = get_spdx_license_index()
+    assert index == {"MIT": MIT_LICENSE}
+    assert get_spdx_license_index() is index
+    assert spdx_session.requests == [licenses.SPDX_LICENSES_URL]
+
+
+def test__get_spdx_license__deserializes_on_demand(spdx_session: StubSession) -> None:
+    license = get_spdx_license("MIT")
+    assert isinstance(license, SpdxLicense)
+    assert license.license_id == "MIT"
+    assert license.name == "MIT License"
+    assert license.is_osi_approved
+    assert license.is_fsf_libre is None
+    with pytest.raises(KeyError):
+        get_spdx_license("Not-A-License")
+
+
+def test__wrap_license_text__keeps_all_words():
+    text = "Permission is hereby granted, free of charge, to any person obtaining a copy of this software"
+    wrapped = wrap_license_text(text, width=30)
+    assert wrapped.split() == text.split()
+    assert all(len(line) <= 30 for line in wrapped.split("\n"))
+
+
+def test__wrap_license_text__preserves_blank_lines():
+    assert wrap_license_text("MIT License\n\nCopyright (c) <year>") == "MIT License\n\nCopyright (c) <year>"
+
+
+def test__wrap_license_text__keeps_indentation_and_tabs_of_long_lines():
+    text = "    (a)\tthe word 'Licensor' shall mean the copyright owner or entity authorized"
+    assert (
+        wrap_license_text(text, width=40)
+        == "    (a)\tthe word 'Licensor' shall mean\nthe copyright owner or entity authorized"
+    )
@@ -0,0 +1,40 @@
+import subprocess as sp
+from pathlib import Path
+
+import pytest
+
+from slap.util.vcs import Author, get_git_author
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A Git repository that is isolated from the system and user Git configuration."""
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / ".gitconfig"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    (tmp_path / ".gitconfig").touch()
+    path = tmp_path / "repo"
+    path.mkdir()
+    sp.check_call(["git", "init", "-q"], cwd=path)
+    return path
+
+
+def git_config(repo: Path, key: str, value: str, global_: bool = False) -> None:
+    sp.check_call(["git", "config", "--global" if global_ else "--local", key, value], cwd=repo)
+
+
+def test__get_git_author__local_config_overrides_global_config(repo: Path) -> None:
+    git_config(repo, "user.name", "Global Name", global_=True)
+    git_config(repo, "user.email", "global@example.org", global_=True)
+    git_config(repo, "user.name", "Local Name")
+    assert get_git_author(repo) == Author("Local Name", "global@example.org")
+
+
+def test__get_git_author__only_email_set(repo: Path) -> None:
+    git_config(repo, "user.email", "me@example.org", global_=True)
+    assert get_git_author(repo) == Author(None, "me@example.org")
+
+
+def test__get_git_author__nothing_set(repo: Path) -> None:
+    assert get_git_author(repo) == Author(None, None)